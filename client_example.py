@@ -1,7 +1,7 @@
 """
 client_example.py
 A simple client to test the Fibonacci server (server.py or fast_server.py).
-Sends a number to the server and prints the response.
+Sends a newline-terminated number to the server and prints the response.
 """
 
 import socket
@@ -12,8 +12,9 @@ def send_fib_request(n: int, host: str = "localhost", port: int = 25000) -> None
     Connect to the Fibonacci server, send a number, and print the response.
     """
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         sock.connect((host, port))
-        sock.sendall(str(n).encode("ascii"))
+        sock.sendall(f"{n}\n".encode("ascii"))
         result = sock.recv(100)
         print(f"Fibonacci({n}) = {result.decode().strip()}")
 
@@ -0,0 +1,22 @@
+# cython: language_level=3
+"""
+Cython version of the countdown() used by threaded.py.
+
+The loop runs inside `with nogil:`, so threads calling countdown() execute
+in parallel. Like the Numba kernel, each iteration also advances a xorshift
+generator and the result is returned, so the C compiler cannot fold the
+loop away to `n = 0`.
+
+threaded.py builds this module on first import via pyximport (needs Cython
+and a C compiler); no setup.py is required.
+"""
+
+def countdown(long long n):
+    cdef unsigned long long x = 88172645463325252
+    with nogil:
+        while n > 0:
+            x ^= x << 13
+            x ^= x >> 7
+            x ^= x << 17
+            n -= 1
+    return x
@@ -5,12 +5,13 @@ lock = threading.Lock()
 
 def worker(n):
     global counter
+    # Count locally, then publish once: one lock acquisition per thread
+    # instead of one per increment.
+    local = 0
     for _ in range(n):
-        lock.acquire()
-        try:
-            counter += 1
-        finally:
-            lock.release()
+        local += 1
+    with lock:
+        counter += local
 
 threads = []
 for i in range(5):
@@ -1,27 +1,62 @@
 import threading
-import queue
 import time
 import random
+from collections import deque
 
-q = queue.Queue(maxsize=10)
+class BatchQueue:
+    """Bounded FIFO that moves items in batches under a single Condition.
+
+    queue.Queue locks and signals once per put()/get(); here a producer
+    hands over a whole batch per lock acquisition and a consumer drains
+    everything available in one go.
+    """
+
+    def __init__(self, maxsize=10):
+        self.maxsize = maxsize
+        self.items = deque()
+        self.cond = threading.Condition()
+
+    def put_many(self, batch):
+        with self.cond:
+            while len(self.items) + len(batch) > self.maxsize and self.items:
+                self.cond.wait()
+            self.items.extend(batch)
+            self.cond.notify_all()
+
+    def get_all(self):
+        with self.cond:
+            while not self.items:
+                self.cond.wait()
+            batch = list(self.items)
+            self.items.clear()
+            self.cond.notify_all()
+            return batch
+
+BATCH_SIZE = 5
+
+q = BatchQueue(maxsize=10)
 stop_sentinel = object()
 
 def producer(num_items):
+    batch = []
     for i in range(num_items):
         item = f"item-{i}"
-        q.put(item)
+        batch.append(item)
         print("Produced", item)
+        if len(batch) == BATCH_SIZE:
+            q.put_many(batch)
+            batch = []
         time.sleep(random.uniform(0.01, 0.1))
-    q.put(stop_sentinel)
+    batch.append(stop_sentinel)
+    q.put_many(batch)
 
 def consumer():
     while True:
-        item = q.get()
-        if item is stop_sentinel:
-            break
-        print("Consumed", item)
-        q.task_done()
-    print("Consumer done")
+        for item in q.get_all():
+            if item is stop_sentinel:
+                print("Consumer done")
+                return
+            print("Consumed", item)
 
 prod = threading.Thread(target=producer, args=(20,))
 cons = threading.Thread(target=consumer)
@@ -2,22 +2,50 @@ import threading
 from collections import OrderedDict
 
 class ThreadSafeLRU:
-    def __init__(self, capacity=128):
+    def __init__(self, capacity=128, shards=1):
+        if shards < 1 or (shards > 1 and shards > capacity):
+            raise ValueError("shards must be between 1 and capacity")
         self.capacity = capacity
-        self.cache = OrderedDict()
-        self.lock = threading.Lock()
+        # Lock striping: each shard is an independent LRU, with its own lock,
+        # over the keys that hash to it, so threads touching different shards
+        # never contend. With shards > 1 eviction is per shard (approximate
+        # LRU); capacity is split as evenly as possible between shards.
+        self.shards = [
+            (threading.Lock(), OrderedDict(),
+             capacity // shards + (1 if i < capacity % shards else 0))
+            for i in range(shards)
+        ]
+        # The default, unsharded cache binds its one shard directly and skips
+        # shard selection (hash, modulo, extra call) on every operation. A
+        # sharded cache has no single lock or dict, so it gets neither attribute.
+        self.single = shards == 1
+        if self.single:
+            self.lock, self.cache, _ = self.shards[0]
+
+    def _shard(self, key):
+        return self.shards[hash(key) % len(self.shards)]
 
     def get(self, key):
-        with self.lock:
-            if key in self.cache:
-                self.cache.move_to_end(key)
-                return self.cache[key]
-            return None
+        if self.single:
+            lock, cache = self.lock, self.cache
+        else:
+            lock, cache, _ = self._shard(key)
+        with lock:
+            if key not in cache:
+                return None
+            cache.move_to_end(key)
+            return cache[key]
 
     def put(self, key, value):
-        with self.lock:
-            if key in self.cache:
-                self.cache.move_to_end(key)
-            self.cache[key] = value
-            if len(self.cache) > self.capacity:
-                removed = self.cache.popitem(last=False)
+        if self.single:
+            lock, cache, shard_capacity = self.lock, self.cache, self.capacity
+        else:
+            lock, cache, shard_capacity = self._shard(key)
+        with lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > shard_capacity:
+                cache.popitem(last=False)
+
+    def __len__(self):
+        return sum(len(cache) for _, cache, _ in self.shards)
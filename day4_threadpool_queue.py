@@ -1,6 +1,4 @@
-import threading
-import queue
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import random
 
@@ -10,31 +8,14 @@ def task(item):
     return item * item
 
 def main():
-    q = queue.Queue(maxsize=50)
+    # The executor already feeds its workers from an internal queue, so submit
+    # everything up front and collect results as they finish; waiting on each
+    # future right after submit would keep only one worker busy at a time.
     with ThreadPoolExecutor(max_workers=4) as executor:
-        def producer():
-            for i in range(100):
-                q.put(i)
-            for _ in range(4):
-                q.put(None)
-
-        def consumer():
-            while True:
-                item = q.get()
-                if item is None:
-                    break
-                future = executor.submit(task, item)
-                result = future.result()
-                print("Result:", result)
-            print("Consumer done")
-
-        t_prod = threading.Thread(target=producer)
-        t_cons = threading.Thread(target=consumer)
-
-        t_prod.start()
-        t_cons.start()
-        t_prod.join()
-        t_cons.join()
+        futures = [executor.submit(task, i) for i in range(100)]
+        for future in as_completed(futures):
+            print("Result:", future.result())
+    print("All tasks done")
 
 if __name__ == "__main__":
     main()
@@ -1,35 +1,68 @@
-import threading
+import multiprocessing
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # fall back to the pure-Python kernel
+    np = None
+
+# The full input as a flat int64 buffer, installed once per worker process.
+_shared = None
 
 def map_fn(chunk):
-    return [x * x for x in chunk]
+    # Each worker returns its partial sum of squares rather than the squared
+    # values, so only one integer per chunk travels back to the parent.
+    if np is not None:
+        # Squaring and summing run in C, but int64 arithmetic wraps silently, so
+        # only take this path when every square and the chunk's total must fit;
+        # anything else (floats, bigger ints) stays exact in pure Python.
+        arr = np.asarray(chunk)
+        if (arr.dtype == np.int64 and arr.size
+                and arr.size * int(np.abs(arr).max()) ** 2 < 2 ** 63):
+            return int(np.square(arr).sum())
+    return sum(x * x for x in chunk)
 
 def reduce_fn(results):
-    total = 0
-    for r in results:
-        total += sum(r)
-    return total
+    return sum(results)
 
-def parallel_map_reduce(data, num_threads=4):
-    chunk_size = len(data) // num_threads
-    threads = []
-    result_list = [None] * num_threads
+def _init_worker(shared):
+    global _shared
+    _shared = shared
 
-    def worker(i, chunk):
-        result_list[i] = map_fn(chunk)
+def _map_range(bounds):
+    # Slicing a memoryview is O(1) and copies nothing; NumPy wraps it in place.
+    start, end = bounds
+    return map_fn(memoryview(_shared)[start:end])
 
-    for i in range(num_threads):
+def parallel_map_reduce(data, num_workers=4, num_threads=None):
+    # Squaring is pure-Python CPU work, so threads would serialize on the GIL;
+    # each chunk is mapped in its own process instead. The data is handed to
+    # each worker once as a flat buffer, and tasks only carry (start, end).
+    # num_threads is the name num_workers had when this used threads.
+    if num_threads is not None:
+        num_workers = num_threads
+    chunk_size = len(data) // num_workers
+    bounds = []
+    for i in range(num_workers):
         start = i * chunk_size
-        end = None if i == num_threads - 1 else (i + 1) * chunk_size
-        t = threading.Thread(target=worker, args=(i, data[start:end]))
-        threads.append(t)
-        t.start()
+        end = len(data) if i == num_workers - 1 else (i + 1) * chunk_size
+        bounds.append((start, end))
 
-    for t in threads:
-        t.join()
+    try:
+        shared = array('q', data)
+    except (TypeError, OverflowError):
+        # Floats or ints beyond int64 don't fit the flat buffer; pickle the
+        # chunks to the workers instead.
+        with multiprocessing.Pool(num_workers) as pool:
+            result_list = pool.map(map_fn, [data[start:end] for start, end in bounds])
+    else:
+        with multiprocessing.Pool(num_workers, initializer=_init_worker,
+                                  initargs=(shared,)) as pool:
+            result_list = pool.map(_map_range, bounds)
 
     return reduce_fn(result_list)
 
 if __name__ == "__main__":
     data = list(range(100000))
-    total = parallel_map_reduce(data, num_threads=4)
+    total = parallel_map_reduce(data, num_workers=4)
     print("Total:", total)
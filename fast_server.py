@@ -1,72 +1,273 @@
 """
 fast_server.py
-A high-throughput Fibonacci microservice server using multiprocessing and a fast Fibonacci algorithm.
+A high-throughput Fibonacci microservice server using asyncio and a fast Fibonacci algorithm.
 
-This server uses a process pool to handle CPU-bound Fibonacci requests in parallel, utilizing all CPU cores.
+With fast doubling and a shared lookup table, fib(n) costs less than shipping the
+request to another process or thread, so the workload is I/O-bound. A single
+asyncio event loop multiplexes every client over epoll/kqueue, avoiding a thread
+stack per connection and GIL hand-offs between handler threads.
+
+Very large n are the exception: they are computed with GMP (via gmpy2, when installed)
+and handed to a thread pool. That is no guarantee against stalls: CPython's bigint
+arithmetic and int-to-str conversion, and gmpy2 by default, hold the GIL for each C
+call, so the loop can only run between calls and the pool adds no parallelism. The
+longest stall is one such call, which MAX_N bounds (without gmpy2, str(F(MAX_N)) alone
+takes about 6.5 ms).
+
+To scale past one core, the server forks one worker process per CPU. Each worker binds
+its own listening socket with SO_REUSEPORT, so the kernel load-balances new connections
+across them without any shared state or a shared GIL. The Fibonacci lookup table is
+filled before forking, so every worker starts with the same warm, copy-on-write table.
 """
 
-from socket import socket, AF_INET, SOCK_STREAM, SOL_SOCKET, SO_REUSEADDR
-from typing import Tuple
-from concurrent.futures import ProcessPoolExecutor
+from socket import (socket, AF_INET, SOCK_STREAM, SOL_SOCKET, SO_REUSEADDR,
+                    SO_RCVBUF, SO_SNDBUF, IPPROTO_TCP, TCP_NODELAY)
+from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import gc
+import os
+import signal
+import socket as socket_module
 import sys
+import traceback
+
+from fib import fib, warm_cache
+
+try:
+    import gmpy2
+except ImportError:  # fall back to the pure-Python fast doubling in fib.py
+    gmpy2 = None
+
+# Requests for n above this are computed on the thread pool (see the module docstring
+# for what that does and does not buy).
+OFFLOAD_THRESHOLD = 10_000
+# Largest n served; F(n) has about 0.209 * n decimal digits. This also bounds how long
+# one request can hold the GIL, and so stall the event loop.
+MAX_N = 100_000
+# Bytes read from a client per call, and the longest request line accepted.
+RECV_SIZE = 65536
+MAX_LINE = 1024
+INVALID_RESPONSE = b'Invalid input\n'
+# Kernel send/receive buffer size for client sockets (inherited from the listener).
+SOCKET_BUFFER_SIZE = 262144
+
+# Python refuses to convert ints of more than 4300 digits to str by default; raise the
+# limit so F(MAX_N) can be sent. Request lines are capped at MAX_LINE, so parsing a
+# request never comes near it.
+if hasattr(sys, "set_int_max_str_digits") and 0 < sys.get_int_max_str_digits() < MAX_N // 4:
+    sys.set_int_max_str_digits(MAX_N // 4)
 
 
 def fib_fast(n: int) -> int:
     """
-    Compute the nth Fibonacci number using an efficient iterative algorithm.
+    Compute the nth Fibonacci number.
+    Small n come from fib.py's lookup table. Large n use GMP's mpz_fib_ui when gmpy2
+    is available, whose C multiply is far faster than Python's bigints and whose
+    mpz result converts to decimal without Python's int-to-str digit limit.
+    """
+    if gmpy2 is not None and n > OFFLOAD_THRESHOLD:
+        return gmpy2.fib(n)
+    return fib(n)
+
+
+def fib_line(n: int) -> bytes:
+    """
+    Compute the nth Fibonacci number as a response line. The decimal conversion is
+    done here too, since for large n it costs more than the computation itself.
+    """
+    return str(fib_fast(n)).encode("ascii") + b'\n'
+
+
+async def respond(req: bytes) -> bytes:
+    """
+    Turn one request line into its response line.
+    Non-numeric and out-of-range requests, or any failure while computing, are
+    answered with an error line instead of raising, so one bad request neither
+    drops the connection nor loses the responses pipelined alongside it.
     """
-    if n <= 2:
-        return 1
-    a, b = 1, 1
-    for _ in range(n - 2):
-        a, b = b, a + b
-    return b
+    try:
+        n: int = int(req)
+        if n > MAX_N:
+            return INVALID_RESPONSE
+        if n > OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(fib_line, n)
+        return fib_line(n)
+    except Exception:
+        return INVALID_RESPONSE
 
 
-def handle_client(client: socket, pool: ProcessPoolExecutor) -> None:
+async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
     """
-    Handle a client connection: receive a number, compute Fibonacci in a process, send result.
+    Handle a client connection: receive newline-terminated numbers, send one result line each.
+    Requests are buffered per connection, so several pipelined requests arriving in one
+    segment (or one request split across segments) are framed correctly, and all the
+    responses for a read go out in a single write. A line longer than MAX_LINE gets a
+    single error response and the rest of it, up to the next newline, is discarded.
     """
+    print("Connection", writer.get_extra_info("peername"))
+    # Disable Nagle so short responses such as b"1\n" are sent immediately.
+    writer.get_extra_info("socket").setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+    buffer = bytearray()
+    discarding = False  # inside an over-long line that was already answered
     while True:
-        req: bytes = client.recv(100)
-        if not req:
+        data: bytes = await reader.read(RECV_SIZE)
+        if not data:
             break
-        try:
-            n: int = int(req)
-        except ValueError:
-            client.sendall(b'Invalid input\n')
-            continue
-        # Submit the computation to the process pool
-        future = pool.submit(fib_fast, n)
-        result: int = future.result()
-        resp: bytes = str(result).encode("ascii") + b'\n'
-        client.sendall(resp)
-    client.close()
+        buffer += data
+        *lines, rest = buffer.split(b'\n')
+        responses: List[bytes] = []
+        for line in lines:
+            if discarding:
+                discarding = False  # end of the over-long line
+            elif len(line) > MAX_LINE:
+                responses.append(INVALID_RESPONSE)
+            else:
+                responses.append(await respond(line))
+        if len(rest) > MAX_LINE and not discarding:
+            responses.append(INVALID_RESPONSE)
+            discarding = True
+        buffer = bytearray() if discarding else rest
+        if responses:
+            writer.write(b''.join(responses))
+            await writer.drain()
+    if buffer.strip():
+        # Accept a final request that the client ended with EOF instead of a newline.
+        writer.write(await respond(buffer))
+        await writer.drain()
+    writer.close()
+    await writer.wait_closed()
     print("Closed")
 
 
-def fast_fib_server(address: Tuple[str, int], max_workers: int = None) -> None:
+async def serve(sock: socket, num_threads: Optional[int] = None) -> None:
+    """
+    Accept clients on an already-bound listening socket until cancelled.
+    Large requests are computed on num_threads threads (default: one per CPU).
+    """
+    # asyncio.to_thread() runs on the loop's default executor.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=num_threads or available_cpus()))
+    server = await asyncio.start_server(handle_client, sock=sock)
+    async with server:
+        await server.serve_forever()
+
+
+def listen(address: Tuple[str, int], reuse_port: bool = False) -> socket:
     """
-    Start a TCP server that computes Fibonacci numbers using a process pool for high throughput.
+    Create a listening TCP socket, optionally sharing its port with sibling processes.
     """
     sock = socket(AF_INET, SOCK_STREAM)
     sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+    # Set before listen() so accepted sockets inherit them and the receive window
+    # scale is negotiated for the larger buffer.
+    sock.setsockopt(SOL_SOCKET, SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(SOL_SOCKET, SO_RCVBUF, SOCKET_BUFFER_SIZE)
+    if reuse_port:
+        sock.setsockopt(SOL_SOCKET, socket_module.SO_REUSEPORT, 1)
     sock.bind(address)
-    sock.listen(5)
-    print(f"Fast Fibonacci server listening on {address}")
-    with ProcessPoolExecutor(max_workers=max_workers) as pool:
-        while True:
-            client, addr = sock.accept()
-            print("Connection", addr)
-            # Each client handled in a new thread, computation in a process
-            from threading import Thread
-            Thread(target=handle_client, args=(client, pool), daemon=True).start()
+    sock.listen(128)
+    return sock
+
+
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may run on, which in a container or under taskset
+    can be fewer than os.cpu_count().
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_worker(address: Tuple[str, int], worker_id: int, reuse_port: bool) -> None:
+    """
+    Run one server process and serve on its own socket. When it is one of several
+    SO_REUSEPORT workers, pin it to a CPU where supported.
+    """
+    num_threads: Optional[int] = None
+    if reuse_port and hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[worker_id % len(cpus)]})
+        # Affinity covers every thread of the process, so offload threads beyond
+        # the one pinned CPU would only take turns on it.
+        num_threads = 1
+    sock = listen(address, reuse_port)
+    print(f"Worker {worker_id} (pid {os.getpid()}) listening on {address}")
+    try:
+        asyncio.run(serve(sock, num_threads))
+    except KeyboardInterrupt:
+        pass
+
+
+def fast_fib_server(address: Tuple[str, int], num_procs: Optional[int] = None) -> None:
+    """
+    Start a TCP server that computes Fibonacci numbers on one asyncio event loop per process.
+    By default one worker is forked per CPU; platforms without fork() or SO_REUSEPORT
+    fall back to a single in-process worker.
+    """
+    if num_procs is None:
+        num_procs = available_cpus()
+    if not (hasattr(os, "fork") and hasattr(socket_module, "SO_REUSEPORT")):
+        num_procs = 1
+    print(f"Fast Fibonacci server listening on {address} with {num_procs} process(es)")
+    if num_procs == 1:
+        run_worker(address, 0, reuse_port=False)
+        return
+
+    # Compute the table once here instead of once per worker. Freezing moves it (and
+    # everything else allocated so far) out of the GC's reach, so the workers' collections
+    # do not write to those objects and un-share their copy-on-write pages.
+    warm_cache()
+    gc.freeze()
+    children: List[int] = []
+    for worker_id in range(num_procs):
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                run_worker(address, worker_id, reuse_port=True)
+            except BaseException:
+                traceback.print_exc()
+                status = 1
+            finally:
+                # os._exit() skips interpreter cleanup, including flushing stdio.
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+        children.append(pid)
+
+    # The parent only supervises; make SIGTERM unwind through the cleanup below.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    remaining = set(children)
+    failed = False
+    try:
+        while remaining:
+            pid, status = os.wait()
+            remaining.discard(pid)
+            exit_code = os.waitstatus_to_exitcode(status)
+            if exit_code != 0:
+                print(f"Worker pid {pid} exited with status {exit_code}; stopping the others",
+                      file=sys.stderr)
+                failed = True
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in remaining:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    # Example: run on localhost:25000 (or specify port as argument)
+    # Example: run on localhost:25000 (or specify port and process count as arguments)
     host = "localhost"
     port = 25000
     if len(sys.argv) > 1:
         port = int(sys.argv[1])
-    fast_fib_server((host, port))
+    num_procs = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    fast_fib_server((host, port), num_procs)
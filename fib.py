@@ -1,11 +1,40 @@
 """
 fib.py
-Recursive Fibonacci function used by the server.
+Fast Fibonacci function used by the server.
 """
 
-def fib(n: int) -> int:
+import threading
+
+# Largest n kept in fib's lookup table; bigger inputs use fast doubling.
+_CACHE_LIMIT = 1000
+# Largest n whose Fibonacci number fits in a signed 64-bit integer.
+_INT64_LIMIT = 92
+_cache_lock = threading.Lock()
+
+
+def _fib_doubling(n: int) -> int:
+    """
+    Compute the nth Fibonacci number using the fast-doubling identities:
+        F(2k)   = F(k) * (2*F(k+1) - F(k))
+        F(2k+1) = F(k)**2 + F(k+1)**2
+    Walking the bits of n from most to least significant needs only
+    O(log n) big-integer multiplications instead of O(phi**n) recursive calls.
+    """
+    a, b = 0, 1  # (F(k), F(k+1)) for the bits of n consumed so far
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == "1":
+            a, b = b, a + b
+    return a
+
+
+def fib(n: int, _cache: list = [1, 1]) -> int:
     """
-    Compute the nth Fibonacci number recursively.
+    Compute the nth Fibonacci number.
+    Values up to _CACHE_LIMIT are kept in a list that is extended iteratively
+    on demand and shared by every caller in the process, so repeat requests
+    are a single index with no recursion. Only growing the table takes a
+    lock. Larger n fall back to fast doubling.
     Args:
         n (int): The position in the Fibonacci sequence (1-based).
     Returns:
@@ -13,5 +42,24 @@ def fib(n: int) -> int:
     """
     if n <= 2:
         return 1
-    else:
-        return fib(n-1) + fib(n-2)
\ No newline at end of file
+    if n <= len(_cache):
+        return _cache[n - 1]
+    if n > _CACHE_LIMIT:
+        return _fib_doubling(n)
+    with _cache_lock:
+        for i in range(len(_cache), n):
+            _cache.append(_cache[i - 1] + _cache[i - 2])
+    return _cache[n - 1]
+
+
+def warm_cache() -> None:
+    """
+    Fill the lookup table up to its limit, e.g. before forking worker processes so
+    that they all inherit the computed values instead of each building their own.
+    """
+    fib(_CACHE_LIMIT)
+
+
+# Pre-fill the table for the int64 range, where nearly all requests fall, so those
+# are a plain index from the very first call and never take the growth lock.
+fib(_INT64_LIMIT)
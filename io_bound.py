@@ -28,7 +28,7 @@ benefit enormously from threading or async programming.
 
 import time
 import requests
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import asyncio
 import aiohttp
 
@@ -123,10 +123,11 @@ def threaded_fetch():
         # They start executing immediately in parallel
         future_to_url = {executor.submit(fetch_url, url): url for url in URLS}
         
-        # Collect results as they complete
+        # Collect results as they complete, fastest first, so a slow request
+        # never hides a finished one (or its error) queued behind it
         # This waits for all requests to finish
         results = []
-        for future in future_to_url:
+        for future in as_completed(future_to_url):
             result = future.result()
             results.append(result)
             print(f"Completed: {future_to_url[future]}")
@@ -155,6 +156,9 @@ async def async_fetch_url(session, url):
         # async with automatically handles connection management
         # The await releases control during network I/O
         async with session.get(url) as response:
+            # Download the body too, as requests.get() does in fetch_url(),
+            # so both approaches do the same network work
+            await response.read()
             return f"Status: {response.status} for {url}"
     except Exception as e:
         return f"Error: {e} for {url}"
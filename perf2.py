@@ -2,14 +2,25 @@
 perf2.py
 Benchmark script for measuring throughput (requests per second) of the Fibonacci server.
 Sends as many fast requests as possible and prints the number of requests per second.
+
+Requests are pipelined: a window of PIPELINE_DEPTH requests is sent in one write before
+the matching responses are read, so the round-trip time is paid once per window rather
+than once per request. Pipelining needs a server that frames requests by newline
+(fast_server.py); pass a depth of 1 to benchmark server.py.
+
+Usage: python perf2.py [pipeline_depth]
 """
 
-from socket import socket, AF_INET, SOCK_STREAM
+from socket import socket, AF_INET, SOCK_STREAM, IPPROTO_TCP, TCP_NODELAY
 from threading import Thread
+import sys
 import time
 
+PIPELINE_DEPTH = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+
 # Connect to the server (adjust port as needed)
 sock = socket(AF_INET, SOCK_STREAM)
+sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)  # send each small request immediately
 sock.connect(('localhost', 25000))
 
 n = 0
@@ -26,8 +37,17 @@ def monitor() -> None:
 
 Thread(target=monitor, daemon=True).start()
 
+# A window of fast requests for fib(1)
+window = b'1\n' * PIPELINE_DEPTH
+
 while True:
-    # Send a fast request for fib(1)
-    sock.send(b'1')
-    resp = sock.recv(100)
-    n += 1
+    sock.sendall(window)
+    # Responses may arrive coalesced or split; wait for one line per request
+    pending = PIPELINE_DEPTH
+    while pending:
+        data = sock.recv(65536)
+        if not data:
+            # e.g. server.py, which cannot frame pipelined requests, dropped us
+            raise SystemExit("Server closed the connection")
+        pending -= data.count(b'\n')
+    n += PIPELINE_DEPTH
@@ -24,7 +24,8 @@ def fib_server(address: Tuple[str, int]) -> None:
         client, addr = sock.accept()
         print("Connection", addr)
         #fib_handler(client)
-        Thread(target=fib_handler, args=(client,), ).start()
+        # Daemon threads never keep the process alive after the accept loop exits.
+        Thread(target=fib_handler, args=(client,), daemon=True).start()
 
 
 def fib_handler(client: socket) -> None:
@@ -13,6 +13,8 @@ Key Difference from CPU-bound tasks:
 Expected Results:
 - Sequential: ~4.0 seconds (8 operations × 0.5s each)
 - Threaded: ~0.5 seconds (all operations run concurrently)
+- Asyncio: ~0.5 seconds (same concurrency, a single thread)
+- Processes: ~0.5 seconds plus process start-up (no better than threads)
 - Speedup: ~8x faster!
 
 Why This Works:
@@ -27,10 +29,51 @@ Real-world I/O operations that benefit from threading:
 - Inter-process communication
 """
 
+import argparse
+import asyncio
+import math
+import os
+import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-def simulate_file_operation(file_id, duration=0.5):
+# Simulated I/O wait per operation, in seconds
+OPERATION_TIME = 0.5
+
+# Result messages built once at import, so operations return a shared string
+# instead of formatting a new one on every call; larger ids format on demand
+MAX_FILES = 1024
+_RESULTS = tuple(f"Result from file {i}" for i in range(MAX_FILES))
+
+def result_for(file_id):
+    """
+    Return the result message for an operation.
+    """
+    if 0 <= file_id < MAX_FILES:
+        return _RESULTS[file_id]
+    return f"Result from file {file_id}"
+
+try:
+    # uvloop (libuv-based) has less per-callback overhead than the stdlib loop
+    import uvloop
+except ImportError:  # not installed, or on Windows: use the stdlib event loop
+    uvloop = None
+
+try:
+    # caio submits file reads to the kernel (Linux native AIO) from the event loop
+    import caio
+except ImportError:  # not installed, or not Linux: read files on worker threads
+    caio = None
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on uvloop if available, else asyncio's loop.
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+def simulate_file_operation(file_id, duration=OPERATION_TIME):
     """
     Simulate a file I/O operation using time.sleep().
     
@@ -44,93 +87,265 @@ def simulate_file_operation(file_id, duration=0.5):
         file_id (int): Identifier for this operation
         duration (float): Simulated I/O wait time in seconds
         
+    Nothing is printed here: print() takes the stdout lock, which would
+    make concurrent workers queue up behind each other. Callers report the
+    returned results once timing has stopped.
+    
     Returns:
         str: Result message indicating completion
     """
-    print(f"Starting file operation {file_id}")
     time.sleep(duration)  # GIL is RELEASED here - other threads can run!
-    print(f"Completed file operation {file_id}")
-    return f"Result from file {file_id}"
+    return result_for(file_id)
 
-def sequential_io():
+async def simulate_file_operation_async(file_id, duration=OPERATION_TIME):
     """
-    Execute I/O operations one at a time (sequential).
+    Asyncio version of simulate_file_operation().
     
-    This represents the traditional approach where each operation
-    must complete before the next one begins.
+    await asyncio.sleep() suspends only this coroutine and hands control
+    back to the event loop, so one thread can keep thousands of operations
+    in flight without a thread (and its stack) per operation.
+    
+    Args:
+        file_id (int): Identifier for this operation
+        duration (float): Simulated I/O wait time in seconds
+        
+    Returns:
+        str: Result message indicating completion
+    """
+    await asyncio.sleep(duration)  # Yields to the event loop - other operations run
+    return result_for(file_id)
+
+def read_file(path):
+    """
+    Read a whole file with blocking calls: open, read and close in one function.
+    
+    Asyncio has no non-blocking regular-file API, so real file reads are
+    handed to a worker thread. Bundling all three syscalls here means each
+    file costs ONE hop to the thread pool, instead of one hop per call as
+    with aiofiles-style `await f.read()` wrappers.
     
-    Expected time: 8 operations × 0.5s = 4.0 seconds
+    Args:
+        path (str): File to read
+        
+    Returns:
+        bytes: File contents
     """
-    print("Sequential I/O operations:")
-    print("=" * 30)
+    with open(path, "rb") as f:
+        return f.read()
+
+async def read_file_async(path, aio_context=None):
+    """
+    Read a whole file without blocking the event loop.
     
-    start = time.time()
-    results = []
+    With a caio context the read is submitted to the kernel's asynchronous
+    I/O interface and awaited directly - no thread pool at all. Otherwise
+    the whole read_file() call takes one hop to a worker thread.
     
-    # Execute operations one by one
-    for i in range(8):
-        result = simulate_file_operation(i)
-        results.append(result)
+    Args:
+        path (str): File to read
+        aio_context: caio.AsyncioContext to submit the read to, or None
+        
+    Returns:
+        bytes: File contents
+    """
+    if aio_context is None:
+        return await asyncio.to_thread(read_file, path)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return await aio_context.read(os.fstat(fd).st_size, fd, 0)
+    finally:
+        os.close(fd)
+
+def report(results):
+    """
+    Print every operation's result after the timed section has finished.
+    """
+    for result in results:
+        print(f"Completed: {result}")
+
+def default_workers(n_ops):
+    """
+    Thread count for n_ops simulated operations.
+    
+    One thread per operation lets every wait overlap, but past a few dozen
+    threads each extra worker adds less than 1% while still costing a stack
+    and scheduler time, so the pool is capped at 32.
+    """
+    return min(32, n_ops)
+
+def run(label, run_all, n_ops):
+    """
+    Time one way of executing n_ops simulated operations.
     
-    end = time.time()
+    Every approach below only decides HOW the operations run; this harness
+    does the timing and reporting for all of them, so they are measured
+    identically and adding another approach is a single function.
+    
+    Args:
+        label (str): Name printed for this approach
+        run_all (callable): Takes n_ops, runs the operations, returns results
+        n_ops (int): Number of simulated operations
+        
+    Returns:
+        float: Total execution time in seconds
+    """
+    print(f"\n{label} I/O operations:")
+    print("=" * 30)
+    
+    start = time.perf_counter()
+    results = run_all(n_ops)
+    end = time.perf_counter()
     duration = end - start
-    print(f"\nSequential total time: {duration:.2f} seconds")
+    report(results)
+    print(f"\n{label} total time: {duration:.2f} seconds")
     return duration
 
-def threaded_io():
+def sequential_io(n_ops=8):
+    """
+    Execute I/O operations one at a time (sequential).
+    
+    This represents the traditional approach where each operation
+    must complete before the next one begins.
+    
+    Expected time: n_ops × 0.5s (4.0 seconds for 8 operations)
+    """
+    # Execute operations one by one
+    return [simulate_file_operation(i) for i in range(n_ops)]
+
+def threaded_io(n_ops=8, max_workers=None):
     """
     Execute I/O operations concurrently using threads.
     
     ThreadPoolExecutor manages thread creation and cleanup.
-    All operations start nearly simultaneously and run concurrently
+    Up to max_workers operations run at once (default: default_workers())
     because the GIL is released during time.sleep().
     
+    Expected time: ~0.5 seconds per batch of max_workers operations
+    (0.5 seconds for 8 operations on 8 threads)
+    """
+    max_workers = max_workers or default_workers(n_ops)
+    # Use ThreadPoolExecutor for clean thread management
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map() submits every operation up front - they start immediately -
+        # and yields results in submission order; list() waits for them all,
+        # so this blocks until the slowest operation finishes
+        return list(executor.map(simulate_file_operation, range(n_ops)))
+
+def process_io(n_ops=8, max_workers=None):
+    """
+    Execute I/O operations concurrently using worker processes.
+    
+    Processes sidestep the GIL, but for I/O-bound work there is nothing to
+    gain from that: the GIL is already released while waiting. What remains
+    is the cost of starting interpreters and pickling arguments and results
+    between processes, so this is never faster than threaded_io().
+    
+    Expected time: ~0.5 seconds per batch of max_workers operations,
+    plus process start-up
+    """
+    max_workers = max_workers or default_workers(n_ops)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(simulate_file_operation, range(n_ops)))
+
+def async_io(n_ops=8):
+    """
+    Execute I/O operations concurrently on a single asyncio event loop.
+    
+    asyncio.gather() schedules every coroutine at once; the event loop
+    switches between them whenever one awaits, with no OS threads involved.
+    
     Expected time: ~0.5 seconds (duration of longest operation)
     """
-    print("\nThreaded I/O operations:")
-    print("=" * 30)
+    async def run_all():
+        return await asyncio.gather(*(simulate_file_operation_async(i) for i in range(n_ops)))
+    
+    return run_async(run_all())
+
+def real_file_io(num_files=8, size=1 << 20):
+    """
+    Read real files concurrently from asyncio via read_file_async().
     
-    start = time.time()
+    Writes num_files temporary files of `size` bytes, then reads them all
+    with asyncio.gather(), through caio when it is installed. Page-cached
+    reads are fast, so this shows the pattern rather than a big speedup.
+    """
+    backend = "caio kernel AIO" if caio is not None else "one thread hop per file"
+    print(f"\nAsyncio real file reads ({backend}):")
+    print("=" * 30)
     
-    # Use ThreadPoolExecutor for clean thread management
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        # Submit all operations to thread pool
-        # They will start executing immediately
-        futures = [executor.submit(simulate_file_operation, i) for i in range(8)]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(num_files):
+            path = os.path.join(tmp, f"file_{i}.bin")
+            with open(path, "wb") as f:
+                f.write(os.urandom(size))
+            paths.append(path)
+        
+        async def run_all():
+            if caio is None:
+                return await asyncio.gather(*(read_file_async(p) for p in paths))
+            aio_context = caio.AsyncioContext(max_requests=128)
+            try:
+                return await asyncio.gather(*(read_file_async(p, aio_context) for p in paths))
+            finally:
+                aio_context.close()
         
-        # Wait for all operations to complete
-        # This blocks until the slowest operation finishes
-        [future.result() for future in futures]
+        start = time.perf_counter()
+        contents = run_async(run_all())
+        end = time.perf_counter()
     
-    end = time.time()
     duration = end - start
-    print(f"\nThreaded total time: {duration:.2f} seconds")
+    total_mb = sum(len(c) for c in contents) / (1 << 20)
+    print(f"Read {total_mb:.0f} MiB from {num_files} files in {duration:.4f} seconds")
     return duration
 
-def main():
+def positive_int(value):
+    """
+    argparse type for counts that must be at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def main(n_ops=8, max_workers=None):
     """
     Main function to demonstrate I/O-bound threading performance.
     
     Compares sequential vs threaded execution for the same workload
     to show dramatic performance improvement when GIL is released.
+    
+    Args:
+        n_ops (int): Number of simulated file operations
+        max_workers (int): Thread pool size (default: default_workers())
     """
+    max_workers = max_workers or default_workers(n_ops)
     print("Local I/O-Bound Performance Comparison")
     print("=" * 45)
-    print("Simulating 8 file operations, each taking 0.5 seconds\n")
+    print(f"Simulating {n_ops} file operations, each taking {OPERATION_TIME} seconds\n")
     
-    # Run both approaches with identical workloads
-    seq_time = sequential_io()
-    threaded_time = threaded_io()
+    # Run every approach on the identical workload through the same harness
+    seq_time = run("Sequential", sequential_io, n_ops)
+    threaded_time = run(f"Threaded ({max_workers} workers)",
+                        lambda n: threaded_io(n, max_workers), n_ops)
+    proc_time = run(f"Multi-process ({max_workers} workers)",
+                    lambda n: process_io(n, max_workers), n_ops)
+    async_time = run("Asyncio", async_io, n_ops)
     
     # Calculate and display performance improvement
     print("\n" + "=" * 45)
     print("PERFORMANCE SUMMARY:")
     print("=" * 45)
-    print(f"Sequential time: {seq_time:.2f}s (expected ~4.0s)")
-    print(f"Threaded time:   {threaded_time:.2f}s (expected ~0.5s)")
+    threaded_expected = math.ceil(n_ops / max_workers) * OPERATION_TIME
+    print(f"Sequential time: {seq_time:.2f}s (expected ~{n_ops * OPERATION_TIME:.1f}s)")
+    print(f"Threaded time:   {threaded_time:.2f}s (expected ~{threaded_expected:.1f}s)")
+    print(f"Process time:    {proc_time:.2f}s (expected ~{threaded_expected:.1f}s + start-up)")
+    print(f"Asyncio time:    {async_time:.2f}s (expected ~{OPERATION_TIME:.1f}s)")
     
     speedup = seq_time / threaded_time
     print(f"\nThreading speedup: {speedup:.1f}x faster!")
+    print(f"Asyncio speedup:   {seq_time / async_time:.1f}x faster!")
+    print(f"Process speedup:   {seq_time / proc_time:.1f}x (never better than threads)")
     
     # Explain why threading works for I/O-bound tasks
     print("\nWhy threading works here:")
@@ -138,6 +353,17 @@ def main():
     print("- Other threads can run while one thread waits for I/O")
     print("- True concurrency is achieved for I/O-bound tasks")
     print("- This is the opposite of CPU-bound tasks where GIL blocks concurrency")
+    print("- asyncio overlaps the same waits in ONE thread by awaiting instead of blocking")
+    print("- Processes only add start-up and pickling cost: don't use them for I/O")
+    
+    # Same asyncio pattern applied to real disk reads
+    real_file_io()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ops", type=positive_int, default=8,
+                        help="number of simulated file operations (default: 8)")
+    parser.add_argument("--workers", type=positive_int, default=None,
+                        help="thread pool size (default: one per operation, at most 32)")
+    args = parser.parse_args()
+    main(args.ops, args.workers)
\ No newline at end of file
@@ -0,0 +1,42 @@
+import asyncio
+import pytest
+from fast_server import handle_client, MAX_LINE, MAX_N, OFFLOAD_THRESHOLD
+from fib import fib
+
+async def exchange(*chunks):
+    # Send each chunk as a separate segment, then half-close and read every response.
+    server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for chunk in chunks:
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(0.02)
+        writer.write_eof()
+        data = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+    return data
+
+@pytest.mark.parametrize("chunks, expected", [
+    # several requests coalesced into one segment
+    ((b"1\n2\n10\n",), b"1\n1\n55\n"),
+    # one request split across segments
+    ((b"1", b"0\n"), b"55\n"),
+    # last request terminated by EOF instead of a newline
+    ((b"7\n10",), b"13\n55\n"),
+    ((b"abc\n3\n",), b"Invalid input\n2\n"),
+    # computed on the thread pool, still answered in order
+    ((b"%d\n3\n" % (OFFLOAD_THRESHOLD + 1),),
+     b"%d\n2\n" % fib(OFFLOAD_THRESHOLD + 1)),
+    ((b"%d\n" % MAX_N,), b"%d\n" % fib(MAX_N)),
+    ((b"%d\n3\n" % (MAX_N + 1),), b"Invalid input\n2\n"),
+    # an over-long line gets one error, however it is split
+    ((b"1" * (MAX_LINE + 1) + b"\n3\n",), b"Invalid input\n2\n"),
+    ((b"0" * (MAX_LINE + 76), b"7\n5\n"), b"Invalid input\n5\n"),
+    ((b"1" * 600, b"1" * 600, b"1" * 600 + b"\n3\n"), b"Invalid input\n2\n"),
+    ((b"0" * (MAX_LINE + 1),), b"Invalid input\n"),
+])
+def test_framing(chunks, expected):
+    assert asyncio.run(exchange(*chunks)) == expected
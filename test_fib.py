@@ -0,0 +1,33 @@
+import pytest
+from fib import fib, warm_cache, _fib_doubling, _CACHE_LIMIT, _INT64_LIMIT
+
+def reference(n):
+    a, b = 1, 1
+    for _ in range(n - 1):
+        a, b = b, a + b
+    return a
+
+def test_small_values():
+    assert [fib(n) for n in range(1, 11)] == [1, 1, 2, 3, 5, 8, 13, 21, 34, 55]
+
+def test_matches_reference_across_cache_tiers():
+    # Crosses the pre-filled int64 table, the on-demand growth and fast doubling.
+    ref = [reference(n) for n in range(1, _CACHE_LIMIT + 20)]
+    for n in range(1, _CACHE_LIMIT + 20):
+        assert fib(n) == ref[n - 1], n
+
+@pytest.mark.parametrize("n", [
+    _INT64_LIMIT, _INT64_LIMIT + 1,
+    _CACHE_LIMIT - 1, _CACHE_LIMIT, _CACHE_LIMIT + 1,
+    5000, 12345,
+])
+def test_boundaries(n):
+    assert fib(n) == reference(n)
+
+def test_int64_limit():
+    assert fib(_INT64_LIMIT) < 2 ** 63 <= fib(_INT64_LIMIT + 1)
+
+def test_doubling_matches_table():
+    warm_cache()
+    for n in range(1, _CACHE_LIMIT + 1):
+        assert _fib_doubling(n) == fib(n), n
@@ -1,6 +1,6 @@
 import pytest
 from day3_lru_cache_threadsafe import ThreadSafeLRU
-import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 def test_basic_put_get():
     cache = ThreadSafeLRU(capacity=2)
@@ -18,19 +18,44 @@ def test_eviction_policy():
     assert cache.get("b") == 2
     assert cache.get("c") == 3
 
-def test_concurrent_access():
-    cache = ThreadSafeLRU(capacity=5)
+def test_sharded_capacity():
+    cache = ThreadSafeLRU(capacity=10, shards=4)
+    for i in range(100):
+        cache.put(f"k{i}", i)
+    assert len(cache) <= cache.capacity
+    assert cache.get("k99") == 99
+
+def test_shards_must_not_exceed_capacity():
+    with pytest.raises(ValueError):
+        ThreadSafeLRU(capacity=2, shards=4)
+
+def test_zero_capacity():
+    cache = ThreadSafeLRU(capacity=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_sharded_cache_has_no_single_dict():
+    cache = ThreadSafeLRU(capacity=10, shards=4)
+    assert not hasattr(cache, "cache")
+    assert not hasattr(cache, "lock")
+
+@pytest.mark.parametrize("shards", [1, 4])
+@pytest.mark.parametrize("num_threads,ops", [(2, 1000), (4, 100), (8, 250), (32, 10)])
+def test_concurrent_access(num_threads, ops, shards):
+    cache = ThreadSafeLRU(capacity=5, shards=shards)
 
     def writer(start):
-        for i in range(start, start + 100):
+        for i in range(start, start + ops):
             cache.put(f"k{i}", i)
 
-    threads = [threading.Thread(target=writer, args=(i * 100,)) for i in range(4)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [executor.submit(writer, i * ops) for i in range(num_threads)]
+        # result() re-raises any writer's exception as soon as it finishes
+        for future in as_completed(futures):
+            future.result()
 
     # After all threads complete, ensure cache is still valid structure
-    keys = list(cache.cache.keys())
-    assert len(keys) <= cache.capacity
+    assert len(cache) <= cache.capacity
+    for i in range(num_threads * ops):
+        assert cache.get(f"k{i}") in (None, i)
@@ -0,0 +1,43 @@
+import pytest
+import day5_parallel_map_reduce as day5
+from day5_parallel_map_reduce import map_fn, parallel_map_reduce
+
+def expected(data):
+    return sum(x * x for x in data)
+
+@pytest.mark.parametrize("chunk", [
+    [],
+    list(range(1000)),
+    [-3, 4, -5],
+    # squares that overflow int64 on their own
+    [4_000_000_000, -4_000_000_000],
+    # each square fits, but their sum does not
+    [3_000_000_000] * 2_000,
+    [2 ** 63 - 1],
+])
+def test_map_fn_is_exact(chunk):
+    assert map_fn(chunk) == expected(chunk)
+
+def test_map_fn_without_numpy(monkeypatch):
+    monkeypatch.setattr(day5, "np", None)
+    chunk = [4_000_000_000, 7, -2]
+    assert map_fn(chunk) == expected(chunk)
+
+def test_parallel_map_reduce():
+    data = list(range(100_000))
+    assert parallel_map_reduce(data, num_workers=4) == expected(data)
+
+def test_parallel_map_reduce_large_values():
+    data = [4_000_000_000] * 10 + list(range(1_000))
+    assert parallel_map_reduce(data, num_workers=2) == expected(data)
+
+@pytest.mark.parametrize("data", [
+    [0.5, 1.5, -2.25] * 10,
+    [2 ** 70, 3, -(2 ** 65)],
+])
+def test_parallel_map_reduce_beyond_int64(data):
+    assert parallel_map_reduce(data, num_workers=2) == expected(data)
+
+def test_num_threads_alias():
+    data = list(range(1_000))
+    assert parallel_map_reduce(data, num_threads=3) == expected(data)
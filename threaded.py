@@ -21,12 +21,40 @@ Expected Results:
 
 Alternatives for CPU-bound parallelism:
 - multiprocessing: Use separate processes (no GIL sharing)
+  (benchmarked here with ProcessPoolExecutor, up to one worker per CPU)
 - NumPy/Cython: C extensions that can release the GIL
+- Numba: @njit(nogil=True) compiles a function that releases the GIL
+  (run automatically at the end of this script when numba is installed)
+- Cython: cython_countdown.pyx runs its loop in a `with nogil:` block
+  (run automatically when Cython and a C compiler are available)
 - PyPy: JIT compiler with better threading performance
+- Free-threaded CPython 3.13+ (PEP 703): no GIL at all; this script
+  detects it and reports the thread speedups it then achieves
 """
 
+import multiprocessing
+import os
+import sys
 import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Free-threaded CPython builds (3.13t+, PEP 703) can run without a GIL, in
+# which case plain threads DO speed up countdown()
+IS_FREE_THREADED = hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled()
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; only the pure-Python demo runs without it
+    njit = None
+
+try:
+    # Compile cython_countdown.pyx on first import (needs Cython and a C compiler)
+    import pyximport
+    pyximport.install(language_level=3)
+    from cython_countdown import countdown as countdown_cython
+except ImportError:  # Cython is optional, like Numba
+    countdown_cython = None
 
 def countdown(n):
     """
@@ -42,24 +70,52 @@ def countdown(n):
     while n > 0:
         n -= 1
 
-# Same workload as sequential version for fair comparison
-COUNT = 50000000
-
-print("Multi-threaded version with GIL impact:")
-print("=" * 50)
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def countdown_native(n):
+        """
+        countdown() compiled to machine code by Numba.
+        
+        nogil=True makes the compiled function release the GIL while it
+        runs, so threads calling it execute truly in parallel.
+        
+        A bare `while n > 0: n -= 1` would be constant-folded by LLVM to
+        `n = 0` and time nothing. Each iteration therefore also advances a
+        xorshift generator, whose mix of shifts and xors the compiler can
+        neither fold nor batch, and returns it so the work stays observable.
+        """
+        x = 88172645463325252
+        while n > 0:
+            x ^= x << 13
+            x ^= x >> 7
+            x ^= x << 17
+            n -= 1
+        return x
 
-# Test with different numbers of threads to show GIL impact
-# We expect no performance improvement, demonstrating GIL limitations
-thread_counts = [1, 2, 4, 8]
+def split_work(total, parts):
+    """
+    Split `total` iterations into `parts` chunks that add up to exactly `total`.
+    
+    Plain total//parts would drop the remainder (50,000,000//3 loses 2), so
+    the first total % parts chunks get one extra iteration each.
+    """
+    base, extra = divmod(total, parts)
+    return [base + 1 if i < extra else base for i in range(parts)]
 
-for num_threads in thread_counts:
-    start = time.time()
+def time_threads(target, num_threads, total):
+    """
+    Split `total` iterations of `target` across `num_threads` threads.
+    
+    Returns:
+        float: Wall-clock seconds until every thread has finished
+    """
+    start = time.perf_counter()
     threads = []
     
     # Create and start threads
     # Each thread gets an equal portion of the total work
-    for i in range(num_threads):
-        t = threading.Thread(target=countdown, args=(COUNT//num_threads,))
+    for chunk in split_work(total, num_threads):
+        t = threading.Thread(target=target, args=(chunk,))
         threads.append(t)
         t.start()
     
@@ -68,17 +124,124 @@ for num_threads in thread_counts:
     for t in threads:
         t.join()
     
-    end = time.time()
-    duration = end - start
+    end = time.perf_counter()
+    return end - start
+
+def pin_worker(counter, cpus):
+    """
+    ProcessPoolExecutor initializer: pin this worker to its own CPU.
+    
+    Initializer arguments are identical for every worker, so each one takes
+    the next index from a shared counter to pick a distinct CPU. A pinned
+    worker is never migrated mid-run and keeps its caches warm.
+    
+    Args:
+        counter (multiprocessing.Value): Shared count of workers started
+        cpus (list): CPUs this process is allowed to run on
+    """
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+def time_processes(num_workers, total):
+    """
+    Split `total` iterations of countdown() across `num_workers` processes.
     
-    print(f"{num_threads} thread(s): {duration:.4f} seconds")
+    Each process has its own interpreter and its own GIL, so the chunks
+    really do run in parallel. Where the OS supports it (Linux), each
+    worker is pinned to a different CPU. The timing includes starting
+    the workers.
+    
+    Returns:
+        float: Wall-clock seconds until every worker has finished
+    """
+    pinning = {}
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        pinning = {"initializer": pin_worker,
+                   "initargs": (multiprocessing.Value("i", 0), cpus)}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=num_workers, **pinning) as executor:
+        list(executor.map(countdown, split_work(total, num_workers)))
+    end = time.perf_counter()
+    return end - start
+
+# Same workload as sequential version for fair comparison
+COUNT = 50000000
 
-print("\nFor comparison, single-threaded sequential version:")
-start = time.time()
-countdown(COUNT)
-end = time.time()
-print(f"Sequential: {end - start:.4f} seconds")
+def main():
+    if IS_FREE_THREADED:
+        print("Running on free-threaded CPython: the GIL is DISABLED")
+        print("Multi-threaded version without the GIL:")
+    else:
+        print("Multi-threaded version with GIL impact:")
+    print("=" * 50)
+    
+    # Test with different numbers of threads to show GIL impact
+    # We expect no performance improvement, demonstrating GIL limitations.
+    # On bigger machines the sweep continues up to the CPU count, where GIL
+    # hand-offs between many threads start to cost extra time.
+    # Count only the CPUs this process may run on: under taskset or a container
+    # cpuset that is fewer than os.cpu_count(), and pin_worker() picks from them.
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    thread_counts = sorted({1, 2, 4, 8} | {c for c in (16, 32, cpus) if 8 < c <= cpus})
+    
+    thread_times = {}
+    for num_threads in thread_counts:
+        duration = time_threads(countdown, num_threads, COUNT)
+        thread_times[num_threads] = duration
+        if IS_FREE_THREADED:
+            speedup = thread_times[1] / duration
+            print(f"{num_threads} thread(s): {duration:.4f} seconds "
+                  f"({speedup:.1f}x vs 1 thread)")
+        else:
+            print(f"{num_threads} thread(s): {duration:.4f} seconds")
+    
+    print("\nFor comparison, single-threaded sequential version:")
+    start = time.perf_counter()
+    countdown(COUNT)
+    end = time.perf_counter()
+    print(f"Sequential: {end - start:.4f} seconds")
+    
+    # Separate processes sidestep the GIL; more workers than CPUs only adds
+    # context switching, so the sweep stops at the usable CPU count
+    print("\nMulti-process version (one GIL per process):")
+    print("=" * 50)
+    process_counts = [c for c in thread_counts if c <= cpus] or [1]
+    for num_workers in process_counts:
+        duration = time_processes(num_workers, COUNT)
+        speedup = thread_times[1] / duration
+        print(f"{num_workers} process(es): {duration:.4f} seconds "
+              f"({speedup:.1f}x vs 1 thread)")
+    
+    print("\nConclusion:")
+    if IS_FREE_THREADED:
+        print("Without the GIL, threads run CPU-bound Python code in parallel;")
+        print("compare the thread speedups above with the process speedups.")
+    else:
+        print("Threading provides NO benefit for CPU-bound tasks due to the GIL!")
+        print("For CPU parallelism, use multiprocessing instead.")
+    
+    if njit is not None:
+        # Native code that releases the GIL: now the same threads run in parallel
+        print("\nNumba nogil version (same threads, compiled countdown):")
+        print("=" * 50)
+        countdown_native(1)  # Warm-up: exclude JIT compilation from the timings
+        for num_threads in thread_counts:
+            duration = time_threads(countdown_native, num_threads, COUNT)
+            print(f"{num_threads} thread(s): {duration:.4f} seconds")
+    
+    if countdown_cython is not None:
+        # Same idea ahead-of-time: the C loop runs with the GIL released
+        print("\nCython nogil version (same threads, compiled countdown):")
+        print("=" * 50)
+        for num_threads in thread_counts:
+            duration = time_threads(countdown_cython, num_threads, COUNT)
+            print(f"{num_threads} thread(s): {duration:.4f} seconds")
 
-print("\nConclusion:")
-print("Threading provides NO benefit for CPU-bound tasks due to the GIL!")
-print("For CPU parallelism, use multiprocessing instead.")
\ No newline at end of file
+if __name__ == "__main__":
+    main()